@@ -1,4 +1,6 @@
+from binarycookies._convert import from_netscape, to_cookiejar, to_netscape
 from binarycookies._deserialize import load, loads
+from binarycookies._prune import prune, prunes
 from binarycookies._serialize import dump, dumps
 
-__all__ = ["dump", "dumps", "load", "loads"]
+__all__ = ["dump", "dumps", "from_netscape", "load", "loads", "prune", "prunes", "to_cookiejar", "to_netscape"]
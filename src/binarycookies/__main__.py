@@ -1,4 +1,5 @@
 import json
+import sys
 from datetime import datetime
 from enum import Enum
 from sys import stdout
@@ -7,7 +8,7 @@ from typing import Type
 import typer
 from rich import print
 
-from binarycookies import load
+from binarycookies import load, prune, to_netscape
 
 
 class DateTimeEncoder(json.JSONEncoder):
@@ -20,10 +21,15 @@ class DateTimeEncoder(json.JSONEncoder):
 class OutputType(str, Enum):
     json = "json"
     ascii = "ascii"
+    netscape = "netscape"
 
 
 def cli(file_path: str, output: str = "json"):
     """CLI entrypoint for reading Binary Cookies"""
+    if output == OutputType.netscape:
+        with open(file_path, "rb") as f:
+            to_netscape(f, stdout)
+        return
     with open(file_path, "rb") as f:
         cookies = load(f)
     if output == OutputType.json:
@@ -40,9 +46,26 @@ def cli(file_path: str, output: str = "json"):
             print("-" * 40)
 
 
+def prune_cli(file_path: str, dry_run: bool = False):  # noqa: FBT001, FBT002
+    """CLI entrypoint for removing expired Binary Cookies"""
+    removed = prune(file_path, in_place=not dry_run)
+    if dry_run:
+        print(f"{removed} expired cookies would be removed from {file_path}")
+    else:
+        print(f"Removed {removed} expired cookies from {file_path}")
+
+
+prune_app = typer.Typer(add_completion=False)
+prune_app.command()(prune_cli)
+
+
 def main():
     """CLI entrypoint for reading Binary Cookies"""
-    typer.run(cli)
+    # A file named "prune" can still be read by passing it as a path, e.g. ./prune
+    if sys.argv[1:2] == ["prune"]:
+        typer.main.get_command(prune_app)(args=sys.argv[2:], prog_name="bcparser prune")
+    else:
+        typer.run(cli)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+import time
+from http.cookiejar import Cookie as JarCookie
+from http.cookiejar import CookieJar
+from typing import BinaryIO, Dict, Iterable, List, Optional, TextIO, Union
+
+from binarycookies._deserialize import MAC_EPOCH_OFFSET, RawCookie, iter_raw_cookies, read_binary
+from binarycookies.models import BinaryCookiesDecodeError, Flag
+
+SECURE_BIT = 1
+HTTPONLY_BIT = 4
+HTTPONLY_PREFIX = "#HttpOnly_"
+NETSCAPE_FIELDS = 7
+NETSCAPE_HEADER = "# Netscape HTTP Cookie File\n"
+
+NETSCAPE_FLAGS = {
+    (False, False): Flag.UNKNOWN,
+    (True, False): Flag.SECURE,
+    (False, True): Flag.HTTPONLY,
+    (True, True): Flag.SECURE_HTTPONLY,
+}
+
+
+def _raw_cookies(source: Union[BinaryIO, bytes]) -> Iterable[RawCookie]:
+    """Returns the raw cookies of a binary cookie file object or byte string."""
+    data = source if isinstance(source, bytes) else read_binary(source)
+    return iter_raw_cookies(data)
+
+
+def to_cookiejar(source: Union[BinaryIO, bytes], jar: Optional[CookieJar] = None) -> CookieJar:
+    """Converts a binary cookie file to a http.cookiejar.CookieJar.
+
+    Args:
+        source: A binary file object or byte string containing the binary cookie data.
+        jar: An existing CookieJar to add the cookies to. A new CookieJar is created if omitted.
+    Returns:
+        CookieJar: The jar containing the converted cookies.
+    """
+    if jar is None:
+        jar = CookieJar()
+    for url, name, path, value, flag, expiry, _ in _raw_cookies(source):
+        domain_initial_dot = url.startswith(".")
+        jar.set_cookie(
+            JarCookie(
+                version=0,
+                name=name,
+                value=value,
+                port=None,
+                port_specified=False,
+                domain=url,
+                domain_specified=domain_initial_dot,
+                domain_initial_dot=domain_initial_dot,
+                path=path,
+                path_specified=True,
+                secure=bool(flag & SECURE_BIT),
+                expires=int(expiry) + MAC_EPOCH_OFFSET,
+                discard=False,
+                comment=None,
+                comment_url=None,
+                rest={"HttpOnly": None} if flag & HTTPONLY_BIT else {},
+            )
+        )
+    return jar
+
+
+def to_netscape(source: Union[BinaryIO, bytes], f: TextIO):
+    """Writes a binary cookie file as a Netscape cookies.txt file, as used by curl and wget.
+
+    Lines are written one cookie at a time, so the output is never held in memory as a whole.
+    HttpOnly cookies are written with the "#HttpOnly_" domain prefix used by curl.
+
+    Args:
+        source: A binary file object or byte string containing the binary cookie data.
+        f: The text file-like object to write the cookies.txt data to.
+    """
+    f.write(NETSCAPE_HEADER)
+    for url, name, path, value, flag, expiry, _ in _raw_cookies(source):
+        domain = HTTPONLY_PREFIX + url if flag & HTTPONLY_BIT else url
+        include_subdomains = "TRUE" if url.startswith(".") else "FALSE"
+        secure = "TRUE" if flag & SECURE_BIT else "FALSE"
+        f.write(
+            f"{domain}\t{include_subdomains}\t{path}\t{secure}\t{int(expiry) + MAC_EPOCH_OFFSET}\t{name}\t{value}\n"
+        )
+
+
+def from_netscape(f: TextIO) -> List[Dict]:
+    """Reads a Netscape cookies.txt file into cookie dicts that can be passed to dump or dumps.
+
+    The cookies.txt format has no creation date, so the current time is used instead.
+    Session cookies (an expiry of 0) are skipped, as binary cookie files only hold persistent cookies
+    and a 0 expiry would be read as already expired.
+
+    Args:
+        f: The text file-like object containing the cookies.txt data.
+    Returns:
+        List[Dict]: A list of cookie dicts.
+    Raises:
+        BinaryCookiesDecodeError: If a line is not a valid cookies.txt cookie.
+    """
+    now = int(time.time())
+    cookies = []
+    for line_number, line in enumerate(f, start=1):
+        line = line.rstrip("\r\n")  # noqa: PLW2901
+        httponly = line.startswith(HTTPONLY_PREFIX)
+        if httponly:
+            line = line[len(HTTPONLY_PREFIX) :]  # noqa: PLW2901
+        elif not line or line.startswith("#"):
+            continue
+        fields = line.split("\t", NETSCAPE_FIELDS - 1)
+        if len(fields) != NETSCAPE_FIELDS or not fields[4].lstrip("-").isdigit():
+            raise BinaryCookiesDecodeError(f"Invalid Netscape cookie on line {line_number}.")
+        domain, _, path, secure, expiry, name, value = fields
+        if int(expiry) == 0:
+            continue
+        cookies.append(
+            {
+                "name": name,
+                "value": value,
+                "url": domain,
+                "path": path,
+                "create_datetime": now,
+                "expiry_datetime": int(expiry),
+                "flag": NETSCAPE_FLAGS[(secure.upper() == "TRUE", httponly)],
+            }
+        )
+    return cookies
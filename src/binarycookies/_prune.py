@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+from struct import pack, unpack_from
+from typing import List, Optional, Tuple, Union
+
+from binarycookies._deserialize import MAC_EPOCH_OFFSET, iter_pages, read_binary
+from binarycookies._serialize import date_to_mac_epoch
+from binarycookies.models import Format
+
+PAGE_HEADER = b"\x00\x00\x01\x00"
+PAGE_FOOTER = b"\x00\x00\x00\x00"
+
+
+def _expired_offsets(page: bytes, now: float) -> Tuple[List[int], List[int]]:
+    """Splits the cookie offsets of a page into kept and expired cookies, reading only the expiry dates."""
+    num_cookies = unpack_from(Format.integer, page, 4)[0]
+    kept, expired = [], []
+    for offset in unpack_from(f"<{num_cookies}i", page, 8):
+        (kept if unpack_from(Format.date, page, offset + 40)[0] > now else expired).append(offset)
+    return kept, expired
+
+
+def _rebuild_page(page: bytes, offsets: List[int]) -> bytes:
+    """Builds a new page holding the cookies at the given offsets, copied verbatim from the old page."""
+    cookies = [page[offset : offset + unpack_from(Format.integer, page, offset)[0]] for offset in offsets]
+    cookie_offsets = []
+    position = 12 + (len(cookies) * 4)
+    for cookie in cookies:
+        cookie_offsets.append(position)
+        position += len(cookie)
+    return b"".join(
+        [
+            PAGE_HEADER,
+            pack(Format.integer, len(cookies)),
+            pack(f"<{len(cookies)}i", *cookie_offsets),
+            PAGE_FOOTER,
+            *cookies,
+        ]
+    )
+
+
+def _checksum(pages: List[bytes]) -> bytes:
+    """Calculates the checksum stored after the pages: the sum of every fourth byte of each page."""
+    return pack(">I", sum(sum(page[::4]) for page in pages) & 0xFFFFFFFF)
+
+
+def _prune(data: bytes, now: float) -> Tuple[bytes, int]:
+    """Removes cookies expiring at or before now (mac epoch) and returns the new file data and removed count."""
+    pages = []
+    removed = 0
+    for page in iter_pages(data):
+        kept, expired = _expired_offsets(page, now)
+        removed += len(expired)
+        if not expired:
+            # Untouched pages are copied byte for byte
+            pages.append(page)
+        elif kept:
+            pages.append(_rebuild_page(page, kept))
+    if not removed:
+        return data, 0
+
+    # The trailer starts after the pages declared in the header, read the same way as iter_pages reads them
+    num_pages = unpack_from(Format.integer_be, data, 4)[0]
+    page_sizes = unpack_from(f">{num_pages}i", data, 8)
+    pages_end = min(8 + (num_pages * 4) + sum(len(data) if ps < 0 else ps for ps in page_sizes), len(data))
+    trailer = data[pages_end:]
+    if len(trailer) >= 4:  # noqa: PLR2004
+        trailer = _checksum(pages) + trailer[4:]
+    header = b"cook" + pack(Format.integer_be, len(pages)) + pack(f">{len(pages)}i", *(len(p) for p in pages))
+    return b"".join([header, *pages, trailer]), removed
+
+
+def _mac_now(now: Optional[datetime]) -> float:
+    """Returns the given datetime, or the current time, as mac epoch. Naive datetimes are read as UTC."""
+    if now is None:
+        return time.time() - MAC_EPOCH_OFFSET
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return date_to_mac_epoch(now)
+
+
+def _atomic_write(path: Union[str, os.PathLike], data: bytes):
+    """Writes data to a temporary file next to path and moves it over path."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".binarycookies-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def prunes(data: bytes, now: Optional[datetime] = None) -> bytes:
+    """Removes expired cookies from binary cookie data.
+
+    Pages without expired cookies are copied byte for byte, only pages that lost cookies are rebuilt.
+
+    Args:
+        data: The binary cookie data.
+        now: Cookies expiring at or before this time are removed. Defaults to the current time.
+            A naive datetime is treated as UTC.
+    Returns:
+        bytes: The pruned binary cookie data.
+    """
+    return _prune(data, _mac_now(now))[0]
+
+
+def prune(path: Union[str, os.PathLike], *, now: Optional[datetime] = None, in_place: bool = True) -> int:
+    """Removes expired cookies from a binary cookie file.
+
+    Pages without expired cookies are copied byte for byte, only pages that lost cookies are rebuilt.
+    The file is replaced atomically and left untouched when nothing expired.
+
+    Args:
+        path: Path to the binary cookie file.
+        now: Cookies expiring at or before this time are removed. Defaults to the current time.
+            A naive datetime is treated as UTC.
+        in_place: Whether to rewrite the file. If False, only the number of expired cookies is returned.
+    Returns:
+        int: The number of expired cookies.
+    """
+    with open(path, "rb") as f:
+        data = read_binary(f)
+    pruned, removed = _prune(data, _mac_now(now))
+    if in_place and removed:
+        _atomic_write(path, pruned)
+    return removed
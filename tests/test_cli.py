@@ -1,3 +1,4 @@
+from io import StringIO
 from sys import stdout
 from unittest.mock import patch
 
@@ -56,3 +57,26 @@ def test_cli_ascii_output(tmp_path, capsys):
     assert "-" * 40 in output
     assert "Flag.SECURE" not in output
     assert "Secure" in output
+
+
+def test_cli_netscape_output(tmp_path):
+    file_path = tmp_path / "Cookies.binarycookies"
+    data = {
+        "name": "name",
+        "value": "value",
+        "url": "example.com",
+        "path": "/",
+        "create_datetime": 2032,
+        "expiry_datetime": 2032,
+        "flag": "Secure",
+    }
+    with open(file_path, "wb") as f:
+        dump(data, f)
+
+    with patch("binarycookies.__main__.stdout", new_callable=StringIO) as mock_stdout:
+        cli(str(file_path), output="netscape")
+
+    assert mock_stdout.getvalue().splitlines() == [
+        "# Netscape HTTP Cookie File",
+        "example.com\tFALSE\t/\tTRUE\t2032\tname\tvalue",
+    ]
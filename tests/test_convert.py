@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from io import BytesIO, StringIO
+
+import pytest
+
+from binarycookies import dumps, from_netscape, load, to_cookiejar, to_netscape
+from binarycookies.models import BinaryCookiesDecodeError, Flag
+
+COOKIES = [
+    {
+        "name": "name1",
+        "value": "value1",
+        "url": ".example.com",
+        "path": "/",
+        "flag": "Secure",
+        "create_datetime": "2032-01-02T00:00:00Z",
+        "expiry_datetime": "2032-01-02T00:00:00Z",
+    },
+    {
+        "name": "name2",
+        "value": "value2",
+        "url": "example.org",
+        "path": "/account",
+        "flag": "HttpOnly",
+        "create_datetime": "2033-01-02T00:00:00Z",
+        "expiry_datetime": "2033-01-02T00:00:00Z",
+    },
+]
+
+
+def test_to_cookiejar():
+    jar = to_cookiejar(BytesIO(dumps(COOKIES)))
+    cookies = sorted(jar, key=lambda c: c.name)
+    assert len(cookies) == 2
+
+    assert cookies[0].name == "name1"
+    assert cookies[0].value == "value1"
+    assert cookies[0].domain == ".example.com"
+    assert cookies[0].domain_initial_dot
+    assert cookies[0].path == "/"
+    assert cookies[0].secure
+    assert cookies[0].expires == int(datetime(2032, 1, 2, tzinfo=timezone.utc).timestamp())
+    assert not cookies[0].has_nonstandard_attr("HttpOnly")
+
+    assert cookies[1].domain == "example.org"
+    assert not cookies[1].domain_initial_dot
+    assert cookies[1].path == "/account"
+    assert not cookies[1].secure
+    assert cookies[1].has_nonstandard_attr("HttpOnly")
+
+
+def test_to_netscape():
+    out = StringIO()
+    to_netscape(dumps(COOKIES), out)
+    assert out.getvalue().splitlines() == [
+        "# Netscape HTTP Cookie File",
+        f".example.com\tTRUE\t/\tTRUE\t{int(datetime(2032, 1, 2, tzinfo=timezone.utc).timestamp())}\tname1\tvalue1",
+        f"#HttpOnly_example.org\tFALSE\t/account\tFALSE\t"
+        f"{int(datetime(2033, 1, 2, tzinfo=timezone.utc).timestamp())}\tname2\tvalue2",
+    ]
+
+
+def test_netscape_round_trip():
+    out = StringIO()
+    to_netscape(dumps(COOKIES), out)
+    out.seek(0)
+    cookies = load(BytesIO(dumps(from_netscape(out))))
+
+    assert [c.name for c in cookies] == ["name1", "name2"]
+    assert [c.url for c in cookies] == [".example.com", "example.org"]
+    assert [c.flag for c in cookies] == [Flag.SECURE, Flag.HTTPONLY]
+    assert cookies[0].expiry_datetime == datetime(2032, 1, 2, tzinfo=timezone.utc)
+    assert cookies[1].expiry_datetime == datetime(2033, 1, 2, tzinfo=timezone.utc)
+
+
+def test_from_netscape_skips_comments_and_blank_lines():
+    data = StringIO(
+        "# Netscape HTTP Cookie File\n\n# a comment\nexample.com\tFALSE\t/\tFALSE\t1956528000\tname\tvalue\n"
+    )
+    [cookie] = from_netscape(data)
+    assert cookie["name"] == "name"
+    assert cookie["value"] == "value"
+    assert cookie["url"] == "example.com"
+    assert cookie["flag"] == Flag.UNKNOWN
+    assert cookie["expiry_datetime"] == 1956528000
+
+
+def test_from_netscape_skips_session_cookies():
+    data = StringIO(
+        "example.com\tFALSE\t/\tFALSE\t0\tsession\tvalue\n"
+        "#HttpOnly_example.com\tFALSE\t/\tFALSE\t0\tsession_httponly\tvalue\n"
+        "example.com\tFALSE\t/\tFALSE\t1956528000\tpersistent\tvalue\n"
+    )
+    assert [cookie["name"] for cookie in from_netscape(data)] == ["persistent"]
+
+
+def test_from_netscape_invalid_line():
+    data = StringIO("# Netscape HTTP Cookie File\nexample.com\tFALSE\t/\tFALSE\t0\tname\n")
+    with pytest.raises(BinaryCookiesDecodeError, match="Invalid Netscape cookie on line 2."):
+        from_netscape(data)
+
+
+@pytest.mark.parametrize("count", [128, 1000, 10000])
+def test_bulk_conversion(count):
+    cookies = [dict(COOKIES[i % 2], name=f"name{i}") for i in range(count)]
+    data = dumps(cookies)
+
+    jar = to_cookiejar(BytesIO(data))
+    assert len(jar) == count
+
+    out = StringIO()
+    to_netscape(data, out)
+    out.seek(0)
+    result = from_netscape(out)
+    assert len(result) == count
+    assert [cookie["name"] for cookie in result] == [cookie["name"] for cookie in cookies]
@@ -0,0 +1,140 @@
+from datetime import datetime, timezone
+from io import BytesIO
+from struct import pack
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from binarycookies import dumps, load, prune, prunes
+from binarycookies.__main__ import main, prune_cli
+from binarycookies._serialize import serialize_cookie
+from binarycookies.models import Cookie, Flag
+
+NOW = datetime(2030, 1, 1, tzinfo=timezone.utc)
+PAST = datetime(2020, 1, 1, tzinfo=timezone.utc)
+FUTURE = datetime(2040, 1, 1, tzinfo=timezone.utc)
+
+
+def make_cookie(name, expiry) -> Cookie:
+    return Cookie(
+        name=name,
+        value="value",
+        url="example.com",
+        path="/",
+        flag=Flag.SECURE,
+        create_datetime=PAST,
+        expiry_datetime=expiry,
+    )
+
+
+def make_page(cookies) -> bytes:
+    records = [serialize_cookie(cookie) for cookie in cookies]
+    offsets, position = [], 12 + (len(records) * 4)
+    for record in records:
+        offsets.append(position)
+        position += len(record)
+    return b"".join(
+        [b"\x00\x00\x01\x00", pack("<i", len(records)), pack(f"<{len(records)}i", *offsets), b"\x00" * 4, *records]
+    )
+
+
+def make_file(pages, trailer=b"") -> bytes:
+    header = b"cook" + pack(">i", len(pages)) + pack(f">{len(pages)}i", *(len(page) for page in pages))
+    return b"".join([header, *pages, trailer])
+
+
+def load_bytes(data) -> List[Cookie]:
+    return load(BytesIO(data))
+
+
+def test_prunes_copies_untouched_pages():
+    static_page = make_page([make_cookie("static1", FUTURE), make_cookie("static2", FUTURE)])
+    mixed_page = make_page([make_cookie("fresh", FUTURE), make_cookie("stale", PAST)])
+    expired_page = make_page([make_cookie("gone", PAST)])
+    data = make_file([static_page, mixed_page, expired_page])
+
+    pruned = prunes(data, now=NOW)
+
+    assert pruned[4:8] == pack(">i", 2)
+    assert pruned[16 : 16 + len(static_page)] == static_page
+    assert [cookie.name for cookie in load_bytes(pruned)] == ["static1", "static2", "fresh"]
+
+
+def test_prunes_without_expired_cookies_returns_data_unchanged():
+    data = make_file([make_page([make_cookie("static", FUTURE)])])
+    assert prunes(data, now=NOW) is data
+
+
+def test_prunes_updates_checksum_and_keeps_footer():
+    footer = b"\x07\x17\x20\x05\x00\x00\x00\x4b"
+    data = make_file([make_page([make_cookie("fresh", FUTURE), make_cookie("stale", PAST)])], b"\x00" * 4 + footer)
+
+    pruned = prunes(data, now=NOW)
+
+    page = make_page([make_cookie("fresh", FUTURE)])
+    assert pruned == make_file([page], pack(">I", sum(page[::4])) + footer)
+
+
+def test_prunes_naive_now_is_utc():
+    data = make_file([make_page([make_cookie("fresh", FUTURE), make_cookie("stale", PAST)])])
+    assert prunes(data, now=NOW.replace(tzinfo=None)) == prunes(data, now=NOW)
+
+
+@pytest.mark.parametrize("count", [2, 128, 1000])
+def test_prunes_dumps_output(count):
+    cookies = [make_cookie(f"name{i}", FUTURE if i % 2 else PAST) for i in range(count)]
+    pruned = prunes(dumps(cookies), now=NOW)
+    assert [cookie.name for cookie in load_bytes(pruned)] == [cookie.name for cookie in cookies[1::2]]
+
+
+def test_prune_in_place(tmp_path):
+    file_path = tmp_path / "Cookies.binarycookies"
+    file_path.write_bytes(make_file([make_page([make_cookie("fresh", FUTURE), make_cookie("stale", PAST)])]))
+
+    assert prune(file_path, now=NOW) == 1
+    assert [cookie.name for cookie in load_bytes(file_path.read_bytes())] == ["fresh"]
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+def test_prune_not_in_place(tmp_path):
+    file_path = tmp_path / "Cookies.binarycookies"
+    data = make_file([make_page([make_cookie("fresh", FUTURE), make_cookie("stale", PAST)])])
+    file_path.write_bytes(data)
+
+    assert prune(file_path, now=NOW, in_place=False) == 1
+    assert file_path.read_bytes() == data
+
+
+def test_prune_cli(tmp_path, capsys):
+    file_path = tmp_path / "Cookies.binarycookies"
+    file_path.write_bytes(make_file([make_page([make_cookie("fresh", FUTURE), make_cookie("stale", PAST)])]))
+
+    prune_cli(str(file_path))
+
+    assert "Removed 1 expired cookies" in capsys.readouterr().out
+    assert [cookie.name for cookie in load_bytes(file_path.read_bytes())] == ["fresh"]
+
+
+def test_main_prune_subcommand(tmp_path, capsys):
+    file_path = tmp_path / "Cookies.binarycookies"
+    data = make_file([make_page([make_cookie("fresh", FUTURE), make_cookie("stale", PAST)])])
+    file_path.write_bytes(data)
+
+    with patch("sys.argv", ["bcparser", "prune", str(file_path), "--dry-run"]), pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 0
+    assert "1 expired cookies would be removed" in capsys.readouterr().out
+    assert file_path.read_bytes() == data
+
+
+def test_main_read(tmp_path, capsys):
+    file_path = tmp_path / "Cookies.binarycookies"
+    file_path.write_bytes(make_file([make_page([make_cookie("fresh", FUTURE)])]))
+
+    with patch("sys.argv", ["bcparser", str(file_path), "--output", "ascii"]), pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 0
+    assert "Name: fresh" in capsys.readouterr().out